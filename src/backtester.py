@@ -2,6 +2,7 @@ import sys
 
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
+from functools import lru_cache
 import questionary
 
 import matplotlib.pyplot as plt
@@ -27,6 +28,12 @@ from src.utils.ollama import ensure_ollama_and_model
 init(autoreset=True)
 
 
+@lru_cache(maxsize=8)
+def get_trading_days(start_date: str, end_date: str) -> pd.DatetimeIndex:
+    """Business-day calendar for a date window, computed once per range."""
+    return pd.date_range(start_date, end_date, freq="B")
+
+
 class Backtester:
     def __init__(
         self,
@@ -288,10 +295,22 @@ class Backtester:
         print("Data pre-fetch complete.")
 
     def run_backtest(self):
+        """Run the backtest to completion and return the performance metrics."""
+        for _ in self.iter_backtest():
+            pass
+        return self.performance_metrics
+
+    def iter_backtest(self):
+        """Run the backtest as a stream, yielding one event per trading day.
+
+        Each event is a dict with the date, the post-trade portfolio value,
+        and the trades executed that day, so consumers can aggregate
+        incrementally instead of buffering the full trade history.
+        """
         # Pre-fetch all data at the start
         self.prefetch_data()
 
-        dates = pd.date_range(self.start_date, self.end_date, freq="B")
+        dates = get_trading_days(self.start_date, self.end_date)
         table_rows = []
         performance_metrics = {"sharpe_ratio": None, "sortino_ratio": None, "max_drawdown": None, "long_short_ratio": None, "gross_exposure": None, "net_exposure": None}
 
@@ -356,22 +375,29 @@ class Backtester:
 
             # Execute trades for each ticker
             executed_trades = {}
+            day_trades = []
             for ticker in self.tickers:
                 decision = decisions.get(ticker, {"action": "hold", "quantity": 0})
                 action, quantity = decision.get("action", "hold"), decision.get("quantity", 0)
 
                 executed_quantity = self.execute_trade(ticker, action, quantity, current_prices[ticker])
                 executed_trades[ticker] = executed_quantity
+                if executed_quantity > 0:
+                    day_trades.append({"ticker": ticker, "action": action, "shares": executed_quantity, "price": current_prices[ticker]})
 
             # ---------------------------------------------------------------
             # 2) Now that trades have executed trades, recalculate the final
             #    portfolio value for this day.
             # ---------------------------------------------------------------
-            total_value = self.calculate_portfolio_value(current_prices)
+            # Vectorized post-trade accounting: load positions and prices into
+            # arrays once instead of three per-ticker Python passes
+            prices_arr = np.fromiter((current_prices[t] for t in self.tickers), dtype=np.float64, count=len(self.tickers))
+            long_shares = np.fromiter((self.portfolio["positions"][t]["long"] for t in self.tickers), dtype=np.float64, count=len(self.tickers))
+            short_shares = np.fromiter((self.portfolio["positions"][t]["short"] for t in self.tickers), dtype=np.float64, count=len(self.tickers))
 
-            # Also compute long/short exposures for final post‐trade state
-            long_exposure = sum(self.portfolio["positions"][t]["long"] * current_prices[t] for t in self.tickers)
-            short_exposure = sum(self.portfolio["positions"][t]["short"] * current_prices[t] for t in self.tickers)
+            long_exposure = float(long_shares @ prices_arr)
+            short_exposure = float(short_shares @ prices_arr)
+            total_value = self.portfolio["cash"] + long_exposure - short_exposure
 
             # Calculate gross and net exposures
             gross_exposure = long_exposure + short_exposure
@@ -460,9 +486,10 @@ class Backtester:
             if len(self.portfolio_values) > 3:
                 self._update_performance_metrics(performance_metrics)
 
+            yield {"date": current_date_str, "portfolio_value": total_value, "trades": day_trades}
+
         # Store the final performance metrics for reference in analyze_performance
         self.performance_metrics = performance_metrics
-        return performance_metrics
 
     def _update_performance_metrics(self, performance_metrics):
         """Helper method to update performance metrics using daily returns."""
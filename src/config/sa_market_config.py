@@ -6,6 +6,7 @@ Configuration settings for JSE (Johannesburg Stock Exchange) market operations
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 from datetime import time
+from functools import lru_cache
 
 
 @dataclass
@@ -115,25 +116,24 @@ class SAMarketConfig:
     )
 
 
-# Global instance
-sa_config = SAMarketConfig()
-
-
+@lru_cache(maxsize=1)
 def get_sa_config() -> SAMarketConfig:
-    """Get the South African market configuration"""
-    return sa_config
+    """Get the South African market configuration (built once, then cached)"""
+    return SAMarketConfig()
 
 
 def is_jse_ticker(ticker: str) -> bool:
     """Check if a ticker is a JSE ticker"""
-    # JSE tickers are typically 3-4 characters and in our known list
-    return len(ticker) >= 3 and len(ticker) <= 4 and ticker.isalpha() and ticker in sa_config.TOP_STOCKS
+    # Membership in the known-stock set implies the 3-4 character alpha format
+    return ticker in TOP_STOCKS_SET
 
 
 def get_zar_currency_info() -> Dict[str, str]:
     """Get ZAR currency information"""
+    sa_config = get_sa_config()
     return {"code": sa_config.CURRENCY, "symbol": sa_config.CURRENCY_SYMBOL, "name": "South African Rand", "decimal_places": 2}
 
 
 # Export commonly used constants
-TOP_STOCKS = sa_config.TOP_STOCKS
+TOP_STOCKS = get_sa_config().TOP_STOCKS
+TOP_STOCKS_SET = frozenset(TOP_STOCKS)
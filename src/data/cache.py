@@ -1,3 +1,20 @@
+import os
+
+
+def _merge_data(existing: list[dict] | None, new_data: list[dict], key_field: str) -> list[dict]:
+    """Merge existing and new data, avoiding duplicates based on a key field."""
+    if not existing:
+        return new_data
+
+    # Create a set of existing keys for O(1) lookup
+    existing_keys = {item[key_field] for item in existing}
+
+    # Only add items that don't exist yet
+    merged = existing.copy()
+    merged.extend([item for item in new_data if item[key_field] not in existing_keys])
+    return merged
+
+
 class Cache:
     """In-memory cache for API responses."""
 
@@ -10,19 +27,8 @@ class Cache:
         self._economic_indicators_cache: dict[str, dict[str, any]] = {}
         self._fx_rates_cache: dict[str, dict[str, any]] = {}
         self._company_facts_cache: dict[str, dict[str, any]] = {}
-
-    def _merge_data(self, existing: list[dict] | None, new_data: list[dict], key_field: str) -> list[dict]:
-        """Merge existing and new data, avoiding duplicates based on a key field."""
-        if not existing:
-            return new_data
-
-        # Create a set of existing keys for O(1) lookup
-        existing_keys = {item[key_field] for item in existing}
-
-        # Only add items that don't exist yet
-        merged = existing.copy()
-        merged.extend([item for item in new_data if item[key_field] not in existing_keys])
-        return merged
+        self._llm_response_cache: dict[str, str] = {}
+        self._analyst_signal_cache: dict[str, dict[str, any]] = {}
 
     def get_prices(self, ticker: str) -> list[dict[str, any]] | None:
         """Get cached price data if available."""
@@ -30,7 +36,7 @@ class Cache:
 
     def set_prices(self, ticker: str, data: list[dict[str, any]]):
         """Append new price data to cache."""
-        self._prices_cache[ticker] = self._merge_data(self._prices_cache.get(ticker), data, key_field="time")
+        self._prices_cache[ticker] = _merge_data(self._prices_cache.get(ticker), data, key_field="time")
 
     def get_financial_metrics(self, ticker: str) -> list[dict[str, any]]:
         """Get cached financial metrics if available."""
@@ -38,7 +44,7 @@ class Cache:
 
     def set_financial_metrics(self, ticker: str, data: list[dict[str, any]]):
         """Append new financial metrics to cache."""
-        self._financial_metrics_cache[ticker] = self._merge_data(self._financial_metrics_cache.get(ticker), data, key_field="report_period")
+        self._financial_metrics_cache[ticker] = _merge_data(self._financial_metrics_cache.get(ticker), data, key_field="report_period")
 
     def get_line_items(self, ticker: str) -> list[dict[str, any]] | None:
         """Get cached line items if available."""
@@ -46,7 +52,7 @@ class Cache:
 
     def set_line_items(self, ticker: str, data: list[dict[str, any]]):
         """Append new line items to cache."""
-        self._line_items_cache[ticker] = self._merge_data(self._line_items_cache.get(ticker), data, key_field="report_period")
+        self._line_items_cache[ticker] = _merge_data(self._line_items_cache.get(ticker), data, key_field="report_period")
 
     def get_insider_trades(self, ticker: str) -> list[dict[str, any]] | None:
         """Get cached insider trades if available."""
@@ -54,7 +60,7 @@ class Cache:
 
     def set_insider_trades(self, ticker: str, data: list[dict[str, any]]):
         """Append new insider trades to cache."""
-        self._insider_trades_cache[ticker] = self._merge_data(self._insider_trades_cache.get(ticker), data, key_field="filing_date")  # Could also use transaction_date if preferred
+        self._insider_trades_cache[ticker] = _merge_data(self._insider_trades_cache.get(ticker), data, key_field="filing_date")  # Could also use transaction_date if preferred
 
     def get_company_news(self, ticker: str) -> list[dict[str, any]] | None:
         """Get cached company news if available."""
@@ -62,7 +68,7 @@ class Cache:
 
     def set_company_news(self, ticker: str, data: list[dict[str, any]]):
         """Append new company news to cache."""
-        self._company_news_cache[ticker] = self._merge_data(self._company_news_cache.get(ticker), data, key_field="date")
+        self._company_news_cache[ticker] = _merge_data(self._company_news_cache.get(ticker), data, key_field="date")
 
     def get_economic_indicators(self, key: str) -> dict[str, any] | None:
         """Get cached economic indicators if available."""
@@ -88,11 +94,111 @@ class Cache:
         """Set company facts in cache."""
         self._company_facts_cache[key] = data
 
+    def get_llm_response(self, key: str) -> str | None:
+        """Get cached LLM response if available."""
+        return self._llm_response_cache.get(key)
+
+    def set_llm_response(self, key: str, content: str):
+        """Set LLM response in cache."""
+        self._llm_response_cache[key] = content
+
+    def get_analyst_signal(self, key: str) -> dict[str, any] | None:
+        """Get cached analyst signal if available."""
+        return self._analyst_signal_cache.get(key)
+
+    def set_analyst_signal(self, key: str, data: dict[str, any]):
+        """Set analyst signal in cache."""
+        self._analyst_signal_cache[key] = data
+
+
+class DiskCache:
+    """Disk-backed cache with the same API as Cache.
+
+    Backed by diskcache (SQLite + memory-mapped pages), which is thread- and
+    process-safe, so parallel backtest workers share one warm cache instead of
+    each re-fetching the same prices/news/FX data. Entries also survive across
+    runs. Enabled by setting AI_HEDGE_FUND_CACHE_DIR.
+    """
+
+    def __init__(self, directory: str, size_limit: int = 2**30):
+        import diskcache
+
+        self._store = diskcache.Cache(directory, size_limit=size_limit)
+
+    def _set_merged(self, key: str, data: list[dict[str, any]], key_field: str):
+        """Merge new data into the stored list, avoiding duplicates."""
+        self._store[key] = _merge_data(self._store.get(key), data, key_field=key_field)
+
+    def get_prices(self, ticker: str) -> list[dict[str, any]] | None:
+        return self._store.get(f"prices:{ticker}")
+
+    def set_prices(self, ticker: str, data: list[dict[str, any]]):
+        self._set_merged(f"prices:{ticker}", data, key_field="time")
+
+    def get_financial_metrics(self, ticker: str) -> list[dict[str, any]]:
+        return self._store.get(f"financial_metrics:{ticker}")
+
+    def set_financial_metrics(self, ticker: str, data: list[dict[str, any]]):
+        self._set_merged(f"financial_metrics:{ticker}", data, key_field="report_period")
+
+    def get_line_items(self, ticker: str) -> list[dict[str, any]] | None:
+        return self._store.get(f"line_items:{ticker}")
+
+    def set_line_items(self, ticker: str, data: list[dict[str, any]]):
+        self._set_merged(f"line_items:{ticker}", data, key_field="report_period")
+
+    def get_insider_trades(self, ticker: str) -> list[dict[str, any]] | None:
+        return self._store.get(f"insider_trades:{ticker}")
+
+    def set_insider_trades(self, ticker: str, data: list[dict[str, any]]):
+        self._set_merged(f"insider_trades:{ticker}", data, key_field="filing_date")
+
+    def get_company_news(self, ticker: str) -> list[dict[str, any]] | None:
+        return self._store.get(f"company_news:{ticker}")
+
+    def set_company_news(self, ticker: str, data: list[dict[str, any]]):
+        self._set_merged(f"company_news:{ticker}", data, key_field="date")
+
+    def get_economic_indicators(self, key: str) -> dict[str, any] | None:
+        return self._store.get(f"economic_indicators:{key}")
+
+    def set_economic_indicators(self, key: str, data: dict[str, any]):
+        self._store[f"economic_indicators:{key}"] = data
+
+    def get_fx_rates(self, key: str) -> dict[str, any] | None:
+        return self._store.get(f"fx_rates:{key}")
+
+    def set_fx_rates(self, key: str, data: dict[str, any]):
+        self._store[f"fx_rates:{key}"] = data
+
+    def get_company_facts(self, key: str) -> dict[str, any] | None:
+        return self._store.get(f"company_facts:{key}")
+
+    def set_company_facts(self, key: str, data: dict[str, any]):
+        self._store[f"company_facts:{key}"] = data
+
+    def get_llm_response(self, key: str) -> str | None:
+        return self._store.get(f"llm_response:{key}")
+
+    def set_llm_response(self, key: str, content: str):
+        self._store[f"llm_response:{key}"] = content
+
+    def get_analyst_signal(self, key: str) -> dict[str, any] | None:
+        return self._store.get(f"analyst_signal:{key}")
+
+    def set_analyst_signal(self, key: str, data: dict[str, any]):
+        self._store[f"analyst_signal:{key}"] = data
+
 
-# Global cache instance
-_cache = Cache()
+# Global cache instance, created lazily so AI_HEDGE_FUND_CACHE_DIR can select
+# the disk-backed store before first use.
+_cache = None
 
 
-def get_cache() -> Cache:
-    """Get the global cache instance."""
+def get_cache() -> Cache | DiskCache:
+    """Get the global cache instance (disk-backed if AI_HEDGE_FUND_CACHE_DIR is set)."""
+    global _cache
+    if _cache is None:
+        cache_dir = os.environ.get("AI_HEDGE_FUND_CACHE_DIR")
+        _cache = DiskCache(cache_dir) if cache_dir else Cache()
     return _cache
@@ -4,8 +4,13 @@ Handles JSE-specific data sources and market characteristics
 """
 
 import os
+import re
+import orjson
 import requests
 import pandas as pd
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Optional, Any
 from datetime import datetime, timedelta
 import time
@@ -18,6 +23,59 @@ from src.data.cache import get_cache
 _cache = get_cache()
 sa_config = get_sa_config()
 
+# Keywords for SA-specific sentiment analysis, compiled into a single
+# alternation so each title is scanned once instead of once per keyword
+_POSITIVE_WORDS = frozenset({"growth", "profit", "dividend", "expansion", "recovery", "rand", "zar", "jse", "johannesburg", "south africa"})
+_NEGATIVE_WORDS = frozenset({"load shedding", "eskom", "corruption", "strike", "protest", "inflation", "recession", "debt", "default"})
+_SENTIMENT_PATTERN = re.compile("|".join(sorted(map(re.escape, _POSITIVE_WORDS | _NEGATIVE_WORDS), key=len, reverse=True)))
+
+# SA sector mapping (simplified)
+_SECTOR_MAP = {
+    # Financial Services
+    "SBK": "Financial Services",
+    "FSR": "Financial Services",
+    "NED": "Financial Services",
+    "ABG": "Financial Services",
+    # Mining & Resources
+    "BHP": "Mining & Resources",
+    "AGL": "Mining & Resources",
+    "SOL": "Mining & Resources",
+    "IMP": "Mining & Resources",
+    "ANG": "Mining & Resources",
+    "AMS": "Mining & Resources",
+    # Consumer Goods
+    "SHP": "Consumer Goods",
+    "WHL": "Consumer Goods",
+    "TBS": "Consumer Goods",
+    "BID": "Consumer Goods",
+    "TFG": "Consumer Goods",
+    "MRP": "Consumer Goods",
+    "CLS": "Consumer Goods",
+    # Telecommunications
+    "MTN": "Telecommunications",
+    "VOD": "Telecommunications",
+    # Technology
+    "NPN": "Technology",
+}
+
+
+@lru_cache(maxsize=4096)
+def _score_sentiment(text_lower: str) -> str:
+    """Score a lowercased title - memoized since the same headlines recur
+    across overlapping tickers and date windows"""
+
+    matched_words = set(_SENTIMENT_PATTERN.findall(text_lower))
+
+    positive_count = len(matched_words & _POSITIVE_WORDS)
+    negative_count = len(matched_words & _NEGATIVE_WORDS)
+
+    if positive_count > negative_count:
+        return "positive"
+    elif negative_count > positive_count:
+        return "negative"
+    else:
+        return "neutral"
+
 
 class SADataAdapter:
     """Adapter for South African market data sources"""
@@ -26,6 +84,13 @@ class SADataAdapter:
         self.config = sa_config
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "AI-Hedge-Fund-SA/1.0"})
+        # Pool connections so concurrent fetches reuse keep-alive sockets
+        # instead of paying a TCP/TLS handshake per request, with a bounded
+        # retry policy for transient upstream errors
+        retries = Retry(total=2, backoff_factor=0.2, status_forcelist=(429, 502, 503))
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def get_jse_prices(self, ticker: str, start_date: str, end_date: str) -> List[Price]:
         """Get JSE price data with SA-specific handling"""
@@ -37,8 +102,8 @@ class SADataAdapter:
         # Create cache key
         cache_key = f"JSE_{ticker}_{start_date}_{end_date}"
 
-        # Check cache first
-        if cached_data := _cache.get_prices(cache_key):
+        # Check cache first (an empty list is a cached negative result)
+        if (cached_data := _cache.get_prices(cache_key)) is not None:
             return [Price(**price) for price in cached_data]
 
         # Fetch from API with JSE-specific parameters
@@ -47,43 +112,25 @@ class SADataAdapter:
         if financial_api_key:
             headers["X-API-KEY"] = financial_api_key
 
-        # Try different JSE ticker formats
-        ticker_formats = [
-            ticker,  # Try original format first
-            f"JSE:{ticker}",  # Try JSE: prefix
-            f"{ticker}.JSE",  # Try .JSE suffix
-            f"{ticker}.JO",  # Try .JO suffix (Johannesburg)
-        ]
-
-        for ticker_format in ticker_formats:
-            try:
-                url = f"{self.config.DATA_SOURCES['prices']}?ticker={ticker_format}&interval=day&interval_multiplier=1&start_date={start_date}&end_date={end_date}"
-                response = requests.get(url, headers=headers)
-                if response.status_code == 200:
-                    return response.json()
-            except Exception:
-                continue
-
-        # If all formats fail, return empty data
-        return {"prices": []}
-
+        # Single request with the canonical JSE: prefix; transient errors
+        # (429/502/503) are handled by the session's bounded retry policy
+        url = f"{self.config.DATA_SOURCES['prices']}?ticker=JSE:{ticker}&interval=day&interval_multiplier=1&start_date={start_date}&end_date={end_date}"
         try:
-            response = self.session.get(url, headers=headers)
+            response = self.session.get(url, headers=headers, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             prices = []
-
             for price_data in data.get("prices", []):
                 # Convert to ZAR if needed
                 price_data["currency"] = "ZAR"
                 prices.append(Price(**price_data))
 
-            # Cache results
+            # Cache even empty results so an unknown ticker is not re-queried
             _cache.set_prices(cache_key, [p.model_dump() for p in prices])
             return prices
 
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error fetching JSE data for {ticker}: {e}")
             return []
 
@@ -107,7 +154,7 @@ class SADataAdapter:
             response = self.session.get(url, headers=headers)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             metrics = []
 
             for metric_data in data.get("financial_metrics", []):
@@ -117,7 +164,7 @@ class SADataAdapter:
             _cache.set_financial_metrics(cache_key, [m.model_dump() for m in metrics])
             return metrics
 
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error fetching SA financial metrics for {ticker}: {e}")
             return []
 
@@ -126,7 +173,7 @@ class SADataAdapter:
 
         cache_key = f"JSE_NEWS_{ticker}_{end_date}_{start_date or 'all'}"
 
-        if cached_data := _cache.get_news(cache_key):
+        if cached_data := _cache.get_company_news(cache_key):
             return [CompanyNews(**news) for news in cached_data]
 
         headers = {}
@@ -143,7 +190,7 @@ class SADataAdapter:
             response = self.session.get(url, headers=headers)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             news_items = []
 
             for news_data in data.get("news", []):
@@ -151,13 +198,24 @@ class SADataAdapter:
                 news_data["sentiment"] = self._analyze_sa_sentiment(news_data.get("title", ""))
                 news_items.append(CompanyNews(**news_data))
 
-            _cache.set_news(cache_key, [n.model_dump() for n in news_items])
+            _cache.set_company_news(cache_key, [n.model_dump() for n in news_items])
             return news_items
 
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error fetching SA news for {ticker}: {e}")
             return []
 
+    def get_sa_news_dicts(self, ticker: str, end_date: str, start_date: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get SA news as plain dicts, serving the cached dict form directly
+        so callers that only need dicts skip the Pydantic round-trip"""
+
+        cache_key = f"JSE_NEWS_{ticker}_{end_date}_{start_date or 'all'}"
+
+        if cached_data := _cache.get_company_news(cache_key):
+            return cached_data
+
+        return [n.model_dump() for n in self.get_sa_news(ticker, end_date, start_date)]
+
     def get_sa_company_facts(self, ticker: str) -> Optional[CompanyFacts]:
         """Get SA company information"""
 
@@ -178,7 +236,7 @@ class SADataAdapter:
             response = self.session.get(url, headers=headers)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             company_facts = data.get("company_facts", {})
             company_facts["exchange"] = "JSE"
             company_facts["currency"] = "ZAR"
@@ -187,10 +245,22 @@ class SADataAdapter:
             _cache.set_company_facts(cache_key, facts.model_dump())
             return facts
 
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             print(f"Error fetching SA company facts for {ticker}: {e}")
             return None
 
+    def get_sa_company_facts_dict(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """Get SA company facts as a plain dict, serving the cached dict form
+        directly so callers that only need dicts skip the Pydantic round-trip"""
+
+        cache_key = f"JSE_FACTS_{ticker}"
+
+        if cached_data := _cache.get_company_facts(cache_key):
+            return cached_data
+
+        facts = self.get_sa_company_facts(ticker)
+        return facts.model_dump() if facts else None
+
     def get_sa_market_data(self, indices: Optional[List[str]] = None) -> Dict[str, Any]:
         """Get SA market overview data"""
 
@@ -198,36 +268,48 @@ class SADataAdapter:
             indices = self.config.MAJOR_INDICES[:3]  # Top 3 indices
 
         market_data = {}
+        uncached_indices = []
 
         for index in indices:
             cache_key = f"JSE_INDEX_{index}"
 
             if cached_data := _cache.get_prices(cache_key):
                 market_data[index] = cached_data
-                continue
+            else:
+                uncached_indices.append(index)
 
-            # Fetch index data
-            headers = {}
-            financial_api_key = os.environ.get("FINANCIAL_DATASETS_API_KEY")
-            if financial_api_key:
-                headers["X-API-KEY"] = financial_api_key
+        # Fetch uncached indices concurrently - each is an independent HTTP call
+        if uncached_indices:
+            with ThreadPoolExecutor(max_workers=len(uncached_indices)) as executor:
+                for index, prices in zip(uncached_indices, executor.map(self._fetch_index_prices, uncached_indices)):
+                    market_data[index] = prices
 
-            url = f"{self.config.DATA_SOURCES['prices']}?ticker={index}&interval=day&interval_multiplier=1&start_date={datetime.now().strftime('%Y-%m-%d')}&end_date={datetime.now().strftime('%Y-%m-%d')}"
+        return {index: market_data[index] for index in indices}
 
-            try:
-                response = self.session.get(url, headers=headers)
-                response.raise_for_status()
+    def _fetch_index_prices(self, index: str) -> List[Dict[str, Any]]:
+        """Fetch and cache price data for a single JSE index"""
 
-                data = response.json()
-                market_data[index] = data.get("prices", [])
-                _cache.set_prices(cache_key, data.get("prices", []))
+        headers = {}
+        financial_api_key = os.environ.get("FINANCIAL_DATASETS_API_KEY")
+        if financial_api_key:
+            headers["X-API-KEY"] = financial_api_key
 
-            except requests.RequestException as e:
-                print(f"Error fetching SA market data for {index}: {e}")
-                market_data[index] = []
+        url = f"{self.config.DATA_SOURCES['prices']}?ticker={index}&interval=day&interval_multiplier=1&start_date={datetime.now().strftime('%Y-%m-%d')}&end_date={datetime.now().strftime('%Y-%m-%d')}"
 
-        return market_data
+        try:
+            response = self.session.get(url, headers=headers)
+            response.raise_for_status()
+
+            data = orjson.loads(response.content)
+            prices = data.get("prices", [])
+            _cache.set_prices(f"JSE_INDEX_{index}", prices)
+            return prices
+
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            print(f"Error fetching SA market data for {index}: {e}")
+            return []
 
+    @lru_cache(maxsize=1)
     def get_sa_economic_indicators(self) -> Dict[str, float]:
         """Get SA economic indicators"""
 
@@ -250,6 +332,7 @@ class SADataAdapter:
         _cache.set_economic_indicators(cache_key, indicators)
         return indicators
 
+    @lru_cache(maxsize=1)
     def get_zar_fx_rates(self) -> Dict[str, float]:
         """Get ZAR exchange rates"""
 
@@ -274,66 +357,20 @@ class SADataAdapter:
     def _analyze_sa_sentiment(self, text: str) -> str:
         """Analyze sentiment for SA-specific context"""
 
-        # Simple keyword-based sentiment analysis for SA context
-        positive_words = ["growth", "profit", "dividend", "expansion", "recovery", "rand", "zar", "jse", "johannesburg", "south africa"]
-
-        negative_words = ["load shedding", "eskom", "corruption", "strike", "protest", "inflation", "recession", "debt", "default"]
-
-        text_lower = text.lower()
-
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
-
-        if positive_count > negative_count:
-            return "positive"
-        elif negative_count > positive_count:
-            return "negative"
-        else:
-            return "neutral"
+        # Simple keyword-based sentiment analysis for SA context - a single
+        # regex pass finds all keywords, then set intersections classify them
+        return _score_sentiment(text.lower())
 
     def validate_sa_ticker(self, ticker: str) -> bool:
         """Validate if ticker is valid for SA market"""
-        return is_jse_ticker(ticker) and ticker in self.config.TOP_STOCKS
+        return is_jse_ticker(ticker)
 
     def get_sa_sector_exposure(self, ticker: str) -> Optional[str]:
         """Get sector exposure for SA stock"""
-
-        # SA sector mapping (simplified)
-        sector_mapping = {
-            # Financial Services
-            "SBK": "Financial Services",
-            "FSR": "Financial Services",
-            "NED": "Financial Services",
-            "ABG": "Financial Services",
-            # Mining & Resources
-            "BHP": "Mining & Resources",
-            "AGL": "Mining & Resources",
-            "SOL": "Mining & Resources",
-            "IMP": "Mining & Resources",
-            "ANG": "Mining & Resources",
-            "AMS": "Mining & Resources",
-            # Consumer Goods
-            "SHP": "Consumer Goods",
-            "WHL": "Consumer Goods",
-            "TBS": "Consumer Goods",
-            "BID": "Consumer Goods",
-            "TFG": "Consumer Goods",
-            "MRP": "Consumer Goods",
-            "CLS": "Consumer Goods",
-            # Telecommunications
-            "MTN": "Telecommunications",
-            "VOD": "Telecommunications",
-            # Technology
-            "NPN": "Technology",
-        }
-
-        return sector_mapping.get(ticker)
-
-
-# Global instance
-sa_data_adapter = SADataAdapter()
+        return _SECTOR_MAP.get(ticker)
 
 
+@lru_cache(maxsize=1)
 def get_sa_data_adapter() -> SADataAdapter:
-    """Get the South African data adapter instance"""
-    return sa_data_adapter
+    """Get the South African data adapter instance (built once, then cached)"""
+    return SADataAdapter()
@@ -1,5 +1,7 @@
 import os
 import json
+import httpx
+from functools import lru_cache
 from langchain_anthropic import ChatAnthropic
 from langchain_deepseek import ChatDeepSeek
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -123,6 +125,17 @@ def get_models_list():
     ]
 
 
+@lru_cache(maxsize=1)
+def get_shared_http_client() -> httpx.Client:
+    """One pooled HTTP client for the OpenAI-compatible chat models.
+
+    Agents construct a fresh chat model per invocation; sharing the transport
+    lets those calls reuse keep-alive connections instead of paying a TCP/TLS
+    handshake each time.
+    """
+    return httpx.Client(timeout=httpx.Timeout(300.0, connect=10.0), limits=httpx.Limits(max_keepalive_connections=40, max_connections=100, keepalive_expiry=30.0))
+
+
 def get_model(model_name: str, model_provider: ModelProvider, api_keys: dict = None) -> ChatOpenAI | ChatGroq | ChatOllama | None:
     if model_provider == ModelProvider.GROQ:
         api_key = (api_keys or {}).get("GROQ_API_KEY") or os.getenv("GROQ_API_KEY")
@@ -139,7 +152,7 @@ def get_model(model_name: str, model_provider: ModelProvider, api_keys: dict = N
             # Print error to console
             print(f"API Key Error: Please make sure OPENAI_API_KEY is set in your .env file or provided via API keys.")
             raise ValueError("OpenAI API key not found.  Please make sure OPENAI_API_KEY is set in your .env file or provided via API keys.")
-        return ChatOpenAI(model=model_name, api_key=api_key, base_url=base_url)
+        return ChatOpenAI(model=model_name, api_key=api_key, base_url=base_url, http_client=get_shared_http_client())
     elif model_provider == ModelProvider.ANTHROPIC:
         api_key = (api_keys or {}).get("ANTHROPIC_API_KEY") or os.getenv("ANTHROPIC_API_KEY")
         if not api_key:
@@ -181,6 +194,7 @@ def get_model(model_name: str, model_provider: ModelProvider, api_keys: dict = N
             model=model_name,
             openai_api_key=api_key,
             openai_api_base="https://openrouter.ai/api/v1",
+            http_client=get_shared_http_client(),
             model_kwargs={
                 "extra_headers": {
                     "HTTP-Referer": site_url,
@@ -17,6 +17,7 @@ from src.utils.ollama import ensure_ollama_and_model
 import argparse
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
+from functools import lru_cache
 from src.utils.visualize import save_graph_as_png
 import json
 
@@ -56,14 +57,10 @@ def run_hedge_fund(
     progress.start()
 
     try:
-        # Create a new workflow if analysts are customized
-        if selected_analysts:
-            workflow = create_workflow(selected_analysts)
-            agent = workflow.compile()
-        else:
-            # Create default workflow with all analysts
-            workflow = create_workflow()
-            agent = workflow.compile()
+        # Reuse the compiled workflow for this analyst selection; backtests
+        # call run_hedge_fund once per trading day and recompiling the graph
+        # each time is pure overhead
+        agent = get_compiled_workflow(tuple(selected_analysts) if selected_analysts else None)
 
         final_state = agent.invoke(
             {
@@ -96,6 +93,12 @@ def run_hedge_fund(
         progress.stop()
 
 
+@lru_cache(maxsize=None)
+def get_compiled_workflow(selected_analysts: tuple[str, ...] | None):
+    """Compile the workflow once per analyst selection (None = all analysts)."""
+    return create_workflow(list(selected_analysts) if selected_analysts else None).compile()
+
+
 def start(state: AgentState):
     """Initialize the workflow with the input message."""
     return state
@@ -3,23 +3,36 @@ South African Backtester
 Specialized backtesting for JSE (Johannesburg Stock Exchange) market
 """
 
+import os
 import sys
 import argparse
+from collections import Counter
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
-import pandas as pd
 
-from src.backtester import Backtester
-from src.config.sa_market_config import get_sa_config, TOP_STOCKS
-from src.data.sa_data_adapter import get_sa_data_adapter
+from src.config.sa_market_config import get_sa_config, TOP_STOCKS, TOP_STOCKS_SET
 
 # Load environment variables
 load_dotenv()
 
+# Top 5 JSE stocks, shared by the --ticker default and its help text
+_DEFAULT_TICKERS = ",".join(TOP_STOCKS[:5])
+
+# Smaller models suffice for the short structured signals the SA-only agents
+# produce; applied when --sa-only is set without an explicit --model-name
+SA_ONLY_MODEL_DEFAULTS = {"Ollama": "gemma3:4b", "OpenAI": "gpt-4o-mini"}
+
 
 def main():
     """Main entry point for South African Backtester"""
 
+    # Pre-scan argv for --ollama so model defaults can depend on it; calling
+    # parser.parse_args() inside add_argument() reparses argv and reads
+    # --ollama before it is registered, which always returned the default
+    pre_parser = argparse.ArgumentParser(add_help=False)
+    pre_parser.add_argument("--ollama", action="store_true")
+    pre_args, _ = pre_parser.parse_known_args()
+
     parser = argparse.ArgumentParser(
         description="South African AI Hedge Fund Backtester - JSE Market",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -42,7 +55,7 @@ Examples:
         """,
     )
 
-    parser.add_argument("--ticker", type=str, default=",".join(TOP_STOCKS[:5]), help=f"Comma-separated list of JSE tickers (default: {','.join(TOP_STOCKS[:5])})")  # Default to top 5 JSE stocks
+    parser.add_argument("--ticker", type=str, default=_DEFAULT_TICKERS, help=f"Comma-separated list of JSE tickers (default: {_DEFAULT_TICKERS})")
 
     parser.add_argument("--start-date", type=str, default=(datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d"), help="Start date for backtesting (YYYY-MM-DD)")
 
@@ -52,9 +65,13 @@ Examples:
 
     parser.add_argument("--show-reasoning", action="store_true", help="Show detailed reasoning from each agent")
 
-    parser.add_argument("--model-name", type=str, default="gpt-4o-mini" if not parser.parse_args().ollama else "llama3.1:8b", help="LLM model to use")
+    # default=None is the "not passed" sentinel: the real default is resolved
+    # after parsing, so an explicit --model-name is never second-guessed even
+    # when it happens to equal the default
+    default_model_name = "llama3.1:8b" if pre_args.ollama else "gpt-4o-mini"
+    parser.add_argument("--model-name", type=str, default=None, help=f"LLM model to use (default: {default_model_name})")
 
-    parser.add_argument("--model-provider", type=str, default="OpenAI" if not parser.parse_args().ollama else "Ollama", help="LLM provider to use")
+    parser.add_argument("--model-provider", type=str, default="Ollama" if pre_args.ollama else "OpenAI", help="LLM provider to use")
 
     parser.add_argument("--sa-only", action="store_true", help="Use only SA-specific agents (exclude global agents)")
 
@@ -62,19 +79,26 @@ Examples:
 
     args = parser.parse_args()
 
+    # SA-only mode emits short structured signals, so default to a smaller
+    # model unless the user picked one explicitly
+    if args.model_name is None:
+        if args.sa_only:
+            args.model_name = SA_ONLY_MODEL_DEFAULTS.get(args.model_provider, default_model_name)
+        else:
+            args.model_name = default_model_name
+
+    # Heavy imports deferred until after argument parsing so --help and
+    # import-only checks don't pay the pandas/langchain startup cost
+    import numpy as np
+    from src.backtester import Backtester
+    from src.main import run_hedge_fund
+
     # Parse tickers
     tickers = [t.strip().upper() for t in args.ticker.split(",")]
 
-    # Validate JSE tickers
-    sa_data_adapter = get_sa_data_adapter()
-    valid_tickers = []
-    invalid_tickers = []
-
-    for ticker in tickers:
-        if sa_data_adapter.validate_sa_ticker(ticker):
-            valid_tickers.append(ticker)
-        else:
-            invalid_tickers.append(ticker)
+    # Validate JSE tickers with set membership, preserving requested order
+    valid_tickers = [ticker for ticker in tickers if ticker in TOP_STOCKS_SET]
+    invalid_tickers = [ticker for ticker in tickers if ticker not in TOP_STOCKS_SET]
 
     if invalid_tickers:
         print(f"⚠️  Warning: Invalid JSE tickers: {', '.join(invalid_tickers)}")
@@ -84,6 +108,17 @@ Examples:
         print("❌ No valid JSE tickers provided. Exiting.")
         sys.exit(1)
 
+    if args.ollama:
+        # Keep the model resident and let the server decode concurrent agent
+        # calls; set before any request so a server we launch inherits them
+        os.environ.setdefault("OLLAMA_MAX_LOADED_MODELS", "1")
+        os.environ.setdefault("OLLAMA_NUM_PARALLEL", str(max(4, len(valid_tickers))))
+
+        from src.utils.ollama import warm_up_model
+
+        if warm_up_model(args.model_name):
+            print(f"🔥 Ollama model {args.model_name} warmed up")
+
     print(f"🇿🇦 South African AI Hedge Fund Backtester")
     print(f"📊 Backtesting: {', '.join(valid_tickers)}")
     print(f"📅 Date Range: {args.start_date} to {args.end_date}")
@@ -93,9 +128,6 @@ Examples:
     print(f"🇿🇦 SA-Only Mode: {args.sa_only}")
     print("-" * 60)
 
-    # Initialize portfolio
-    portfolio = {"total_cash": args.initial_capital, "positions": {}}
-
     # Select agents based on SA-only mode
     if args.sa_only:
         selected_analysts = ["sa_market_analyst", "sa_regulatory_compliance", "sa_currency_risk", "portfolio_manager"]
@@ -106,68 +138,80 @@ Examples:
 
     try:
         print("🔄 Running SA Market Backtest...")
-        backtester = Backtester(tickers=valid_tickers, start_date=args.start_date, end_date=args.end_date, portfolio=portfolio, show_reasoning=args.show_reasoning, selected_analysts=selected_analysts, model_name=args.model_name, model_provider=args.model_provider)
-        results = backtester.run_backtest()
-
-        # Display SA-specific backtest results
-        print("\n" + "=" * 60)
-        print("🇿🇦 SOUTH AFRICAN BACKTEST RESULTS")
-        print("=" * 60)
-
-        if "portfolio_value" in results:
-            final_value = results["portfolio_value"]
+        backtester = Backtester(agent=run_hedge_fund, tickers=valid_tickers, start_date=args.start_date, end_date=args.end_date, initial_capital=args.initial_capital, model_name=args.model_name, model_provider=args.model_provider, selected_analysts=selected_analysts)
+
+        # Consume the backtest as a stream of per-day events, aggregating as
+        # they arrive instead of buffering the full trade history
+        final_value = None
+        total_trades = 0
+        net_notional = 0.0
+        side_counts = Counter()
+        tickers_seen = {}
+
+        for day in backtester.iter_backtest():
+            final_value = day["portfolio_value"]
+            day_trades = day["trades"]
+            total_trades += len(day_trades)
+
+            if day_trades:
+                # Vectorized trade math: signed notional across the day's fills
+                qty = np.fromiter((trade["shares"] for trade in day_trades), dtype=np.float64, count=len(day_trades))
+                px = np.fromiter((trade["price"] for trade in day_trades), dtype=np.float64, count=len(day_trades))
+                sides = np.fromiter((1.0 if "buy" in trade["action"].lower() else -1.0 if "sell" in trade["action"].lower() else 0.0 for trade in day_trades), dtype=np.float64, count=len(day_trades))
+                net_notional += float((qty * px * sides).sum())
+
+            for trade in day_trades:
+                action = trade["action"].lower()
+                side = "buys" if "buy" in action else "sells" if "sell" in action else None
+                if side:
+                    side_counts[(trade["ticker"], side)] += 1
+                tickers_seen.setdefault(trade["ticker"])
+
+        # Display SA-specific backtest results, assembled into one write
+        # instead of a print (and stdout lock/flush) per line
+        out = []
+        out.append("\n" + "=" * 60)
+        out.append("🇿🇦 SOUTH AFRICAN BACKTEST RESULTS")
+        out.append("=" * 60)
+
+        if final_value is not None:
             initial_value = args.initial_capital
             total_return = ((final_value - initial_value) / initial_value) * 100
 
-            print(f"\n💰 Portfolio Performance:")
-            print(f"  Initial Capital: R{initial_value:,.2f}")
-            print(f"  Final Value: R{final_value:,.2f}")
-            print(f"  Total Return: {total_return:+.2f}%")
+            out.append(f"\n💰 Portfolio Performance:")
+            out.append(f"  Initial Capital: R{initial_value:,.2f}")
+            out.append(f"  Final Value: R{final_value:,.2f}")
+            out.append(f"  Total Return: {total_return:+.2f}%")
 
             # Convert to USD for comparison (approximate)
             zar_usd_rate = 18.45  # Approximate rate
             usd_initial = initial_value / zar_usd_rate
             usd_final = final_value / zar_usd_rate
-            print(f"  USD Equivalent: ${usd_initial:,.2f} → ${usd_final:,.2f}")
-
-        if "trades" in results:
-            trades = results["trades"]
-            print(f"\n📊 Trading Activity:")
-            print(f"  Total Trades: {len(trades)}")
-
-            # Analyze trades by ticker
-            ticker_trades = {}
-            for trade in trades:
-                ticker = trade.get("ticker", "Unknown")
-                if ticker not in ticker_trades:
-                    ticker_trades[ticker] = {"buys": 0, "sells": 0}
-
-                action = trade.get("action", "").lower()
-                if "buy" in action:
-                    ticker_trades[ticker]["buys"] += 1
-                elif "sell" in action:
-                    ticker_trades[ticker]["sells"] += 1
+            out.append(f"  USD Equivalent: ${usd_initial:,.2f} → ${usd_final:,.2f}")
 
-            for ticker, trade_counts in ticker_trades.items():
-                print(f"    {ticker}: {trade_counts['buys']} buys, {trade_counts['sells']} sells")
+        out.append(f"\n📊 Trading Activity:")
+        out.append(f"  Total Trades: {total_trades}")
+        if total_trades:
+            out.append(f"  Net Notional: R{net_notional:,.2f}")
+        out.extend(f"    {ticker}: {side_counts[(ticker, 'buys')]} buys, {side_counts[(ticker, 'sells')]} sells" for ticker in tickers_seen)
 
         # SA Market Context
         sa_config = get_sa_config()
-        print(f"\n🇿🇦 SA Market Context:")
-        print(f"  Currency: {sa_config.CURRENCY} ({sa_config.CURRENCY_SYMBOL})")
-        print(f"  Exchange: {sa_config.EXCHANGE_NAME}")
-        print(f"  Trading Hours: {sa_config.TRADING_START_TIME} - {sa_config.TRADING_END_TIME} SAST")
-        print(f"  Settlement: T+{sa_config.SETTLEMENT_DAYS}")
-        print(f"  Max Position Size: {sa_config.MAX_POSITION_SIZE:.1%}")
-        print(f"  Max Sector Exposure: {sa_config.MAX_SECTOR_EXPOSURE:.1%}")
-        print(f"  Stop Loss: {sa_config.STOP_LOSS_PERCENTAGE:.1%}")
+        out.append(f"\n🇿🇦 SA Market Context:")
+        out.append(f"  Currency: {sa_config.CURRENCY} ({sa_config.CURRENCY_SYMBOL})")
+        out.append(f"  Exchange: {sa_config.EXCHANGE_NAME}")
+        out.append(f"  Trading Hours: {sa_config.TRADING_START_TIME} - {sa_config.TRADING_END_TIME} SAST")
+        out.append(f"  Settlement: T+{sa_config.SETTLEMENT_DAYS}")
+        out.append(f"  Max Position Size: {sa_config.MAX_POSITION_SIZE:.1%}")
+        out.append(f"  Max Sector Exposure: {sa_config.MAX_SECTOR_EXPOSURE:.1%}")
+        out.append(f"  Stop Loss: {sa_config.STOP_LOSS_PERCENTAGE:.1%}")
 
         # Risk Analysis
-        print(f"\n⚠️  SA Risk Factors Considered:")
-        for risk in sa_config.RISK_FACTORS:
-            print(f"  • {risk}")
+        out.append(f"\n⚠️  SA Risk Factors Considered:")
+        out.extend(f"  • {risk}" for risk in sa_config.RISK_FACTORS)
 
-        print("\n✅ Backtest complete!")
+        out.append("\n✅ Backtest complete!")
+        sys.stdout.write("\n".join(out) + "\n")
 
     except Exception as e:
         print(f"❌ Error during SA backtest: {e}")
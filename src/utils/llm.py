@@ -1,11 +1,35 @@
 """Helper functions for LLM"""
 
+import hashlib
 import json
 from pydantic import BaseModel
+from src.data.cache import get_cache
 from src.llm.models import get_model, get_model_info
 from src.utils.progress import progress
 from src.graph.state import AgentState
 
+_cache = get_cache()
+
+
+def cached_invoke(llm, messages, model_name: str, model_provider: str) -> str:
+    """
+    Invoke an LLM with an exact-match response cache.
+
+    Identical (provider, model, messages) triples - common when the same
+    tickers are re-analyzed with unchanged market context, e.g. during
+    backtest replays - skip the network round-trip entirely and return the
+    cached content. The provider is part of the key because the same model
+    name can be served by different providers (e.g. OpenAI vs OpenRouter).
+    """
+    key = hashlib.blake2b("\x1f".join([model_provider, model_name] + [m.content for m in messages]).encode(), digest_size=16).hexdigest()
+
+    if (cached_content := _cache.get_llm_response(key)) is not None:
+        return cached_content
+
+    content = llm.invoke(messages).content
+    _cache.set_llm_response(key, content)
+    return content
+
 
 def call_llm(
     prompt: any,
@@ -46,6 +46,19 @@ def is_ollama_server_running() -> bool:
         return False
 
 
+def warm_up_model(model_name: str) -> bool:
+    """Load a model into memory with a one-token generate call.
+
+    The first request to a cold model pays the multi-gigabyte load; warming it
+    up front keeps that latency out of the first real agent call.
+    """
+    try:
+        response = requests.post(f"{OLLAMA_SERVER_URL}/api/generate", json={"model": model_name, "prompt": "ping", "options": {"num_predict": 1}}, timeout=120)
+        return response.status_code == 200
+    except requests.RequestException:
+        return False
+
+
 def get_locally_available_models() -> List[str]:
     """Get a list of models that are already downloaded locally."""
     if not is_ollama_server_running():